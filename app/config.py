@@ -3,6 +3,7 @@ Application configuration using Pydantic settings.
 Loads from environment variables with validation.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -15,12 +16,14 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./racklab.db"
+    db_pool_pre_ping: bool = False  # enable for networked databases
     
     # Logging
     log_level: str = "INFO"
     
     # Test Configuration
     max_retries: int = 3
+    max_backoff_seconds: float = 5.0
     timeout_seconds: int = 60
     default_test_duration_ms: int = 5000
     
@@ -36,4 +39,12 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings, built on first use.
+    
+    Defers .env parsing and environment coercion until a setting is
+    actually needed rather than at import time.
+    """
+    return Settings()
@@ -5,16 +5,18 @@ Uses SQLAlchemy with SQLite for persistence.
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from app.config import settings
+from app.config import get_settings
 from app.models import Base
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Create engine
+_database_url = get_settings().database_url
 engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    _database_url,
+    connect_args={"check_same_thread": False} if "sqlite" in _database_url else {},
+    pool_pre_ping=get_settings().db_pool_pre_ping
 )
 
 # Session factory
@@ -23,7 +25,7 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     """Initialize database tables."""
-    logger.info("Initializing database", extra={"database_url": settings.database_url})
+    logger.info("Initializing database", extra={"database_url": _database_url})
     Base.metadata.create_all(bind=engine)
     logger.info("Database initialized successfully")
 
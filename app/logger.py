@@ -4,17 +4,29 @@ Provides consistent logging format across the application.
 """
 
 import logging
-import json
-from datetime import datetime
-from app.config import settings
+import time
+import orjson
+from app.config import get_settings
+
+# Standard LogRecord attributes; anything else on a record is an extra field
+_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'lineno', 'module', 'msecs', 'message',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info'
+})
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
     
+    converter = time.gmtime  # UTC timestamps
+    
     def format(self, record):
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": "%s.%03dZ" % (
+                self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), record.msecs
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,20 +35,13 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno
         }
         
-        # Add extra fields if present
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
-        
-        # Add any extra keyword arguments
-        if hasattr(record, '__dict__'):
-            for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                               'levelname', 'lineno', 'module', 'msecs', 'message',
-                               'pathname', 'process', 'processName', 'relativeCreated',
-                               'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info']:
-                    log_data[key] = value
+        # Add extra fields (request_id and any extra keyword arguments),
+        # in the order they were set
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_data[key] = value
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -53,7 +58,7 @@ def get_logger(name: str) -> logging.Logger:
     
     # Only configure if not already configured
     if not logger.handlers:
-        logger.setLevel(getattr(logging, settings.log_level.upper()))
+        logger.setLevel(getattr(logging, get_settings().log_level.upper()))
         
         handler = logging.StreamHandler()
         handler.setFormatter(JSONFormatter())
@@ -3,23 +3,78 @@ Main FastAPI application entry point.
 Includes middleware, rate limiting, and router registration.
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from starlette.middleware.cors import CORSMiddleware
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import logging
+import os
+import time
 
-from app.config import settings
-from app.database import init_db
-from app.logger import get_logger
+from app.database import engine, init_db
+from app.models import TestResultResponse
 from app.routers import tests, dashboard
+from app.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Request logging is skipped entirely when INFO is disabled
+_LOG_REQUESTS = logger.isEnabledFor(logging.INFO)
+
+# /health is static for the life of the process, so its ETag is too
+_HEALTH_STATUS = {
+    "status": "healthy",
+    "version": "1.0.0",
+    "service": "RackLab-RTP"
+}
+_HEALTH_CACHE_HEADERS = {
+    "ETag": '"%s"' % hashlib.blake2b(
+        repr(sorted(_HEALTH_STATUS.items())).encode(), digest_size=8
+    ).hexdigest(),
+    "Cache-Control": "public, max-age=5",
+}
+_HEALTH_ETAG = _HEALTH_CACHE_HEADERS["ETag"]
+
+# Pre-serialized body for unhandled errors
+_ERROR_BODY = b'{"error":"internal_server_error","message":"Unexpected error occurred."}'
+
+
+def _register_routers(app: FastAPI):
+    """Mount the routers and static files."""
+    # Register rate limiter
+    app.state.limiter = tests.limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    
+    # Mount static files
+    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+    
+    # Include routers
+    app.include_router(tests.router, prefix="/api/tests", tags=["tests"])
+    app.include_router(dashboard.router, tags=["dashboard"])
+
+
+async def _warm_up():
+    """
+    Do one-time startup work in parallel before serving traffic:
+    create tables, open a pooled DB connection, compile the page
+    templates and build the response model schema.
+    """
+    
+    def warm_templates():
+        for name in ("dashboard.html", "trigger.html", "test_detail.html"):
+            dashboard.templates.get_template(name)
+    
+    await asyncio.gather(
+        asyncio.to_thread(init_db),
+        asyncio.to_thread(lambda: engine.connect().close()),
+        asyncio.to_thread(warm_templates),
+        asyncio.to_thread(TestResultResponse.model_json_schema),
+    )
 
 
 @asynccontextmanager
@@ -29,7 +84,7 @@ async def lifespan(app: FastAPI):
         "version": "1.0.0",
         "environment": "production"
     })
-    init_db()
+    await _warm_up()
     yield
     logger.info("Shutting down RackLab-RTP application")
 
@@ -39,28 +94,39 @@ app = FastAPI(
     title="RackLab-RTP",
     description="Automated System-Level Bring-up, Validation & Failure Analysis Platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Register rate limiter
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# CORS (preflights cached for 24h so cross-origin POSTs skip the OPTIONS)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+    max_age=86400,
+)
+
+# Routes are registered at import so they exist even without a lifespan run
+# (e.g. TestClient outside a with-block, uvicorn --lifespan off)
+_register_routers(app)
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Include routers
-app.include_router(tests.router, prefix="/api/tests", tags=["tests"])
-app.include_router(dashboard.router, tags=["dashboard"])
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(_: Request, exc: Exception):
+    """Return a JSON 500 for unhandled errors."""
+    # Tracebacks are only formatted when DEBUG logging is enabled
+    logger.error("Unhandled exception: %s", exc, exc_info=logger.isEnabledFor(logging.DEBUG))
+    return Response(content=_ERROR_BODY, media_type="application/json", status_code=500)
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests with structured logging."""
-    import time
-    import uuid
+    if not _LOG_REQUESTS:
+        return await call_next(request)
     
-    request_id = str(uuid.uuid4())
+    request_id = os.urandom(16).hex()
     request.state.request_id = request_id
     
     logger.info("Incoming request", extra={
@@ -70,9 +136,9 @@ async def log_requests(request: Request, call_next):
         "client_ip": request.client.host
     })
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    duration_ms = (time.time() - start_time) * 1000
+    duration_ms = (time.perf_counter() - start_time) * 1000
     
     logger.info("Request completed", extra={
         "request_id": request_id,
@@ -85,10 +151,9 @@ async def log_requests(request: Request, call_next):
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request, response: Response):
     """Health check endpoint for monitoring."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "service": "RackLab-RTP"
-    }
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304, headers=_HEALTH_CACHE_HEADERS)
+    response.headers.update(_HEALTH_CACHE_HEADERS)
+    return _HEALTH_STATUS
@@ -6,8 +6,9 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, DateTime, Text, Index, and_, func, select
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import aliased
 
 Base = declarative_base()
 
@@ -100,6 +101,11 @@ class TestRun(Base):
     injected_failure = Column(String)
     failure_probability = Column(Float)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Serves the RUNNING-by-type idempotency check in TestRunner
+        Index("ix_testrun_status_type", "status", "test_type"),
+    )
 
 
 class RCARecord(Base):
@@ -112,3 +118,16 @@ class RCARecord(Base):
     root_cause = Column(Text, nullable=False)
     recommendations = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Outer-join condition pairing each TestRun with at most one RCARecord,
+# its latest. rca_records.test_id is not unique, so a plain test_id join
+# could duplicate runs and make LIMIT count joined rows. The subquery uses
+# its own alias so it never resolves against the joined rca_records.
+_LatestRCA = aliased(RCARecord)
+LATEST_RCA_JOIN = and_(
+    RCARecord.test_id == TestRun.test_id,
+    RCARecord.id == select(func.max(_LatestRCA.id)).where(
+        _LatestRCA.test_id == TestRun.test_id
+    ).correlate(TestRun).scalar_subquery()
+)
@@ -3,20 +3,86 @@ Dashboard UI routes using Jinja2 templates.
 Provides web interface for test management and visualization.
 """
 
+import hashlib
+import jinja2
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, PlainTextResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 from typing import Optional
 
 from app.database import get_db
-from app.models import TestRun, RCARecord, TestStatus, TestType
+from app.models import TestRun, RCARecord, TestStatus, TestType, LATEST_RCA_JOIN
 from app.logger import get_logger
 
+
+def _create_template_env() -> jinja2.Environment:
+    """
+    Build the Jinja environment for the page templates.
+    
+    Templates never change in a deployed process, so skip the per-render
+    mtime check and cache compiled bytecode. With no directory argument
+    Jinja uses a per-user 0700 cache dir and verifies its ownership.
+    """
+    try:
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        # No usable (or safely owned) temp dir; compile in memory only
+        bytecode_cache = None
+    
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader("app/templates"),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache
+    )
+
+
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+templates = Jinja2Templates(env=_create_template_env())
 logger = get_logger(__name__)
 
+# Filter/select options rendered by the templates (immutable, built once)
+_TEST_TYPES = tuple(t.value for t in TestType)
+_TEST_STATUSES = tuple(s.value for s in TestStatus)
+_FAILURE_TYPES = ("none", "thermal_runaway", "voltage_droop", "boot_failure", "fan_stuck")
+
+# Short TTL for polled pages; revalidated via ETag afterwards
+_CACHE_CONTROL = "public, max-age=5"
+
+# Markdown export templates (str.format placeholders); log lines are
+# streamed between the header and the footer
+_MD_REPORT_HEADER = """# Test Report: {test_id}
+
+## Summary
+- **Test Type**: {test_type}
+- **Status**: {status}
+- **Duration**: {duration_ms}ms
+- **Started**: {started_at}
+- **Completed**: {completed_at}
+
+## Metrics
+```json
+{metrics}
+```
+
+## Logs
+```
+"""
+
+_MD_REPORT_FOOTER = b"```\n"
+
+_MD_RCA_TEMPLATE = """
+## Root Cause Analysis
+- **Category**: {category}
+- **Confidence**: {confidence}%
+- **Root Cause**: {root_cause}
+
+### Recommendations
+{recommendations}
+"""
+
 
 @router.get("/")
 async def dashboard(
@@ -26,6 +92,25 @@ async def dashboard(
     db: Session = Depends(get_db)
 ):
     """Main dashboard showing test history with filters."""
+    # Summary stats (and latest activity per status) in a single GROUP BY pass
+    stats = db.query(
+        TestRun.status, func.count(),
+        func.max(TestRun.started_at), func.max(TestRun.completed_at)
+    ).group_by(TestRun.status).order_by(TestRun.status).all()
+    
+    # Unchanged stats and filters render the same page; let pollers revalidate
+    etag = '"%s"' % hashlib.blake2b(
+        repr((stats, status, test_type)).encode(), digest_size=8
+    ).hexdigest()
+    cache_headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+    
+    counts = {row[0]: row[1] for row in stats}
+    total_tests = sum(counts.values())
+    passed_tests = counts.get(TestStatus.PASSED.value, 0)
+    failed_tests = counts.get(TestStatus.FAILED.value, 0)
+    
     query = db.query(TestRun)
     
     if status:
@@ -36,11 +121,6 @@ async def dashboard(
     
     test_runs = query.order_by(TestRun.started_at.desc()).limit(100).all()
     
-    # Calculate summary stats
-    total_tests = db.query(TestRun).count()
-    passed_tests = db.query(TestRun).filter(TestRun.status == TestStatus.PASSED.value).count()
-    failed_tests = db.query(TestRun).filter(TestRun.status == TestStatus.FAILED.value).count()
-    
     pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
     
     return templates.TemplateResponse("dashboard.html", {
@@ -52,9 +132,9 @@ async def dashboard(
         "pass_rate": round(pass_rate, 1),
         "current_status": status,
         "current_test_type": test_type,
-        "test_types": [t.value for t in TestType],
-        "test_statuses": [s.value for s in TestStatus]
-    })
+        "test_types": _TEST_TYPES,
+        "test_statuses": _TEST_STATUSES
+    }, headers=cache_headers)
 
 
 @router.get("/trigger")
@@ -62,8 +142,8 @@ async def trigger_page(request: Request):
     """Test trigger UI page."""
     return templates.TemplateResponse("trigger.html", {
         "request": request,
-        "test_types": [t.value for t in TestType],
-        "failure_types": ["none", "thermal_runaway", "voltage_droop", "boot_failure", "fan_stuck"]
+        "test_types": _TEST_TYPES,
+        "failure_types": _FAILURE_TYPES
     })
 
 
@@ -74,15 +154,24 @@ async def test_detail(
     db: Session = Depends(get_db)
 ):
     """Detailed view of a single test run."""
-    test_run = db.query(TestRun).filter(TestRun.test_id == test_id).first()
+    # Test run and its RCA in one round-trip, loading only rendered columns
+    row = db.query(TestRun, RCARecord).outerjoin(
+        RCARecord, LATEST_RCA_JOIN
+    ).options(
+        load_only(
+            TestRun.test_id, TestRun.test_type, TestRun.status,
+            TestRun.duration_ms, TestRun.started_at, TestRun.completed_at,
+            TestRun.error_code, TestRun.metrics, TestRun.logs
+        )
+    ).filter(TestRun.test_id == test_id).first()
     
-    if not test_run:
+    if not row:
         return templates.TemplateResponse("dashboard.html", {
             "request": request,
             "error": f"Test {test_id} not found"
         })
     
-    rca = db.query(RCARecord).filter(RCARecord.test_id == test_id).first()
+    test_run, rca = row
     
     return templates.TemplateResponse("test_detail.html", {
         "request": request,
@@ -98,50 +187,51 @@ async def export_report(
     db: Session = Depends(get_db)
 ):
     """Export test report in JSON or Markdown format."""
-    test_run = db.query(TestRun).filter(TestRun.test_id == test_id).first()
+    row = db.query(TestRun, RCARecord).outerjoin(
+        RCARecord, LATEST_RCA_JOIN
+    ).filter(TestRun.test_id == test_id).first()
     
-    if not test_run:
-        return JSONResponse(
+    if not row:
+        return ORJSONResponse(
             status_code=404,
             content={"error": f"Test {test_id} not found"}
         )
     
-    rca = db.query(RCARecord).filter(RCARecord.test_id == test_id).first()
+    test_run, rca = row
     
     if format == "markdown":
-        md_content = f"""# Test Report: {test_id}
-
-## Summary
-- **Test Type**: {test_run.test_type}
-- **Status**: {test_run.status}
-- **Duration**: {test_run.duration_ms}ms
-- **Started**: {test_run.started_at}
-- **Completed**: {test_run.completed_at}
-
-## Metrics
-```json
-{test_run.metrics}
-```
-
-## Logs
-```
-{chr(10).join(test_run.logs or [])}
-```
-"""
+        header = _MD_REPORT_HEADER.format(
+            test_id=test_id,
+            test_type=test_run.test_type,
+            status=test_run.status,
+            duration_ms=test_run.duration_ms,
+            started_at=test_run.started_at,
+            completed_at=test_run.completed_at,
+            metrics=test_run.metrics
+        ).encode("utf-8")
+        logs = test_run.logs or ()
         
+        rca_section = None
         if rca:
-            md_content += f"""
-## Root Cause Analysis
-- **Category**: {rca.category}
-- **Confidence**: {rca.confidence * 100}%
-- **Root Cause**: {rca.root_cause}
-
-### Recommendations
-{chr(10).join(f"- {r}" for r in rca.recommendations or [])}
-"""
+            rca_section = _MD_RCA_TEMPLATE.format(
+                category=rca.category,
+                confidence=rca.confidence * 100,
+                root_cause=rca.root_cause,
+                recommendations="\n".join(f"- {r}" for r in rca.recommendations or ())
+            ).encode("utf-8")
+        
+        async def stream_report():
+            yield header
+            for line in logs:
+                yield line.encode("utf-8") + b"\n"
+            if not logs:
+                yield b"\n"
+            yield _MD_REPORT_FOOTER
+            if rca_section:
+                yield rca_section
         
-        return PlainTextResponse(
-            content=md_content,
+        return StreamingResponse(
+            stream_report(),
             media_type="text/markdown",
             headers={"Content-Disposition": f"attachment; filename=test-{test_id}.md"}
         )
@@ -152,8 +242,8 @@ async def export_report(
             "test_type": test_run.test_type,
             "status": test_run.status,
             "duration_ms": test_run.duration_ms,
-            "started_at": test_run.started_at.isoformat() if test_run.started_at else None,
-            "completed_at": test_run.completed_at.isoformat() if test_run.completed_at else None,
+            "started_at": test_run.started_at,
+            "completed_at": test_run.completed_at,
             "error_code": test_run.error_code,
             "metrics": test_run.metrics,
             "logs": test_run.logs
@@ -167,7 +257,7 @@ async def export_report(
                 "recommendations": rca.recommendations
             }
         
-        return JSONResponse(
+        return ORJSONResponse(
             content=report,
             headers={"Content-Disposition": f"attachment; filename=test-{test_id}.json"}
         )
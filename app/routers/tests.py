@@ -13,11 +13,11 @@ from app.auth import verify_token
 from app.database import get_db
 from app.models import (
     TestRunRequest, TestRunResponse, TestResultResponse,
-    TestRun, TestStatus, TestType
+    TestRun, RCARecord, TestStatus, TestType, LATEST_RCA_JOIN
 )
 from app.services.test_runner import TestRunner
 from app.logger import get_logger
-from app.config import settings
+from app.config import get_settings
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -25,7 +25,7 @@ limiter = Limiter(key_func=get_remote_address)
 
 
 @router.post("/run", response_model=TestRunResponse)
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+@limiter.limit(f"{get_settings().rate_limit_per_minute}/minute")
 async def run_test(
     request: TestRunRequest,
     db: Session = Depends(get_db),
@@ -72,17 +72,18 @@ async def get_test_result(
     db: Session = Depends(get_db)
 ):
     """Retrieve test results by test_id."""
-    test_run = db.query(TestRun).filter(TestRun.test_id == test_id).first()
+    # Test run and its RCA result (if available) in one query
+    row = db.query(TestRun, RCARecord).outerjoin(
+        RCARecord, LATEST_RCA_JOIN
+    ).filter(TestRun.test_id == test_id).first()
     
-    if not test_run:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Test {test_id} not found"
         )
     
-    # Get RCA result if available
-    from app.models import RCARecord
-    rca = db.query(RCARecord).filter(RCARecord.test_id == test_id).first()
+    test_run, rca = row
     rca_result = None
     if rca:
         rca_result = {
@@ -114,7 +115,7 @@ async def list_tests(
     db: Session = Depends(get_db)
 ):
     """List test runs with optional filters."""
-    query = db.query(TestRun)
+    query = db.query(TestRun, RCARecord).outerjoin(RCARecord, LATEST_RCA_JOIN)
     
     if status:
         query = query.filter(TestRun.status == status.value)
@@ -122,23 +123,20 @@ async def list_tests(
     if test_type:
         query = query.filter(TestRun.test_type == test_type.value)
     
-    test_runs = query.order_by(TestRun.started_at.desc()).limit(limit).all()
-    
-    # Get RCA results for all tests
-    from app.models import RCARecord
-    rca_map = {}
-    for rca in db.query(RCARecord).filter(
-        RCARecord.test_id.in_([t.test_id for t in test_runs])
-    ).all():
-        rca_map[rca.test_id] = {
-            "category": rca.category,
-            "confidence": rca.confidence,
-            "root_cause": rca.root_cause,
-            "recommendations": rca.recommendations
-        }
+    # Test runs paired with their latest RCA result (if any) in one query
+    rows = query.order_by(TestRun.started_at.desc()).limit(limit).all()
     
     results = []
-    for test_run in test_runs:
+    for test_run, rca in rows:
+        rca_result = None
+        if rca:
+            rca_result = {
+                "category": rca.category,
+                "confidence": rca.confidence,
+                "root_cause": rca.root_cause,
+                "recommendations": rca.recommendations
+            }
+        
         results.append(TestResultResponse(
             test_id=test_run.test_id,
             test_type=test_run.test_type,
@@ -149,7 +147,7 @@ async def list_tests(
             error_code=test_run.error_code,
             metrics=test_run.metrics or {},
             logs=test_run.logs or [],
-            rca_result=rca_map.get(test_run.test_id)
+            rca_result=rca_result
         ))
     
     return results
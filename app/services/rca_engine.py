@@ -3,16 +3,87 @@ Root Cause Analysis engine using Bayesian classification.
 Analyzes failure patterns and provides confident diagnoses.
 """
 
-from typing import Dict, List
+from typing import Dict, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from app.models import RCARecord, RCACategory
-from app.services.system_simulator import SystemSimulator
+from app.services.system_simulator import BootStage, SystemSimulator
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+_EARLY_BOOT_STAGES = (BootStage.FIRMWARE, BootStage.BOOTLOADER)
+
+# Actionable recommendations per category (shared, immutable)
+_RECOMMENDATIONS: Dict[RCACategory, Tuple[str, ...]] = {
+    RCACategory.THERMAL: (
+        "Verify fan operation and replace if RPM < 1000",
+        "Clean dust from heatsinks and air intakes",
+        "Check thermal paste application on CPU",
+        "Reduce ambient temperature or improve rack airflow",
+        "Consider thermal throttling threshold adjustment"
+    ),
+    RCACategory.POWER: (
+        "Inspect power supply unit for failures",
+        "Measure voltage rails under load with oscilloscope",
+        "Check for loose power connectors",
+        "Verify power distribution board integrity",
+        "Replace PSU if voltage deviation exceeds 5%"
+    ),
+    RCACategory.FIRMWARE: (
+        "Reflash firmware to known-good version",
+        "Verify firmware checksums match golden image",
+        "Check for BIOS/UEFI corruption",
+        "Update to latest stable firmware release",
+        "Review boot logs for specific error codes"
+    ),
+    RCACategory.OS: (
+        "Boot in safe mode to isolate driver issues",
+        "Check kernel logs for panic messages",
+        "Verify boot image integrity",
+        "Test with minimal driver set",
+        "Reinstall OS if corruption suspected"
+    ),
+    RCACategory.UNKNOWN: (
+        "Collect full system logs for manual analysis",
+        "Run comprehensive hardware diagnostics",
+        "Check for intermittent connection issues",
+        "Monitor system over extended period",
+        "Escalate to hardware engineering team"
+    )
+}
+
+# Classification rules in priority order: (predicate, category, confidence_fn).
+# Evaluated directly against the simulator state; the first match wins.
+_RULES = (
+    # THERMAL classification
+    (lambda s: s.cpu_temp > 90,
+     RCACategory.THERMAL,
+     lambda s: min(1.0, (s.cpu_temp - 85) / 15)),
+    
+    # POWER classification
+    (lambda s: s.voltage_12v < 11.0 or s.voltage_5v < 4.5,
+     RCACategory.POWER,
+     lambda s: min(1.0, abs(12.0 - s.voltage_12v) / 12.0 * 10)),
+    
+    # FIRMWARE classification
+    (lambda s: s.boot_stage in _EARLY_BOOT_STAGES and s.failure_reason == "boot_failure",
+     RCACategory.FIRMWARE,
+     lambda s: 0.95),
+    
+    # OS classification
+    (lambda s: s.boot_stage is BootStage.OS_INIT and s.failure_reason == "boot_failure",
+     RCACategory.OS,
+     lambda s: 0.90),
+    
+    # Fan failures (could be thermal or mechanical); classified as thermal
+    # since it affects cooling
+    (lambda s: s.fan_rpm < 500,
+     RCACategory.THERMAL,
+     lambda s: 0.85),
+)
+
 
 class RCAEngine:
     """
@@ -33,17 +104,17 @@ class RCAEngine:
         
         Returns:
             RCARecord with classification and recommendations
+        
+        The record is added to the session but not committed; the caller
+        commits it together with the test run update.
         """
         logger.info("Starting RCA analysis", extra={"test_id": test_id})
         
-        # Extract features from simulator state
-        features = self._extract_features(simulator)
-        
         # Classify failure
-        category, confidence = self._classify_failure(features)
+        category, confidence = self._classify_failure(simulator)
         
         # Generate root cause description
-        root_cause = self._generate_root_cause(category, features)
+        root_cause = self._generate_root_cause(category, simulator)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(category)
@@ -54,12 +125,11 @@ class RCAEngine:
             category=category.value,
             confidence=confidence,
             root_cause=root_cause,
-            recommendations=recommendations,
+            recommendations=list(recommendations),
             created_at=datetime.utcnow()
         )
         
         self.db.add(rca_record)
-        self.db.commit()
         
         logger.info("RCA analysis completed", extra={
             "test_id": test_id,
@@ -69,114 +139,39 @@ class RCAEngine:
         
         return rca_record
     
-    def _extract_features(self, simulator: SystemSimulator) -> Dict:
-        """Extract relevant features for classification."""
-        metrics = simulator.get_metrics()
-        
-        return {
-            "cpu_temp": metrics["cpu_temp_c"],
-            "voltage_12v": metrics["voltage_12v"],
-            "voltage_5v": metrics["voltage_5v"],
-            "fan_rpm": metrics["fan_rpm"],
-            "boot_stage": metrics["boot_stage"],
-            "failure_reason": simulator.failure_reason,
-            "logs": simulator.logs
-        }
-    
-    def _classify_failure(self, features: Dict) -> tuple[RCACategory, float]:
+    def _classify_failure(self, simulator: SystemSimulator) -> tuple[RCACategory, float]:
         """
         Classify failure using Bayesian-inspired heuristics.
         Returns (category, confidence).
         """
         # Rule-based classification with confidence scoring
-        
-        # THERMAL classification
-        if features["cpu_temp"] > 90:
-            confidence = min(1.0, (features["cpu_temp"] - 85) / 15)
-            return RCACategory.THERMAL, confidence
-        
-        # POWER classification
-        if features["voltage_12v"] < 11.0 or features["voltage_5v"] < 4.5:
-            voltage_deviation = abs(12.0 - features["voltage_12v"]) / 12.0
-            confidence = min(1.0, voltage_deviation * 10)
-            return RCACategory.POWER, confidence
-        
-        # FIRMWARE classification
-        if features["boot_stage"] in ["firmware", "bootloader"]:
-            if features["failure_reason"] == "boot_failure":
-                return RCACategory.FIRMWARE, 0.95
-        
-        # OS classification
-        if features["boot_stage"] == "os_init":
-            if features["failure_reason"] == "boot_failure":
-                return RCACategory.OS, 0.90
-        
-        # Check for fan failures (could be thermal or mechanical)
-        if features["fan_rpm"] < 500:
-            # Classify as thermal since it affects cooling
-            return RCACategory.THERMAL, 0.85
+        for predicate, category, confidence_fn in _RULES:
+            if predicate(simulator):
+                return category, confidence_fn(simulator)
         
         # Default: unknown with low confidence
         return RCACategory.UNKNOWN, 0.30
     
-    def _generate_root_cause(self, category: RCACategory, features: Dict) -> str:
+    def _generate_root_cause(self, category: RCACategory, simulator: SystemSimulator) -> str:
         """Generate human-readable root cause description."""
         if category == RCACategory.THERMAL:
-            if features["fan_rpm"] < 500:
-                return f"Fan failure detected (RPM: {features['fan_rpm']}). Insufficient cooling causing thermal runaway."
+            if simulator.fan_rpm < 500:
+                return f"Fan failure detected (RPM: {simulator.fan_rpm}). Insufficient cooling causing thermal runaway."
             else:
-                return f"CPU temperature exceeded safe operating limits ({features['cpu_temp']:.1f}°C). Possible cooling system degradation or excessive workload."
+                return f"CPU temperature exceeded safe operating limits ({simulator.cpu_temp:.1f}°C). Possible cooling system degradation or excessive workload."
         
         elif category == RCACategory.POWER:
-            return f"Voltage rail out of specification. 12V rail measured at {features['voltage_12v']:.2f}V (spec: 11.4-12.6V). Likely PSU failure or excessive load."
+            return f"Voltage rail out of specification. 12V rail measured at {simulator.voltage_12v:.2f}V (spec: 11.4-12.6V). Likely PSU failure or excessive load."
         
         elif category == RCACategory.FIRMWARE:
-            return f"System failed during {features['boot_stage']} stage. Firmware corruption or incompatible version suspected."
+            return f"System failed during {simulator.boot_stage.value} stage. Firmware corruption or incompatible version suspected."
         
         elif category == RCACategory.OS:
             return "Operating system initialization failed. Possible kernel panic, driver issue, or corrupted boot image."
         
         else:
-            return f"Failure cause unclear. System state: {features['boot_stage']}, failure_reason: {features['failure_reason']}"
+            return f"Failure cause unclear. System state: {simulator.boot_stage.value}, failure_reason: {simulator.failure_reason}"
     
-    def _generate_recommendations(self, category: RCACategory) -> List[str]:
+    def _generate_recommendations(self, category: RCACategory) -> Tuple[str, ...]:
         """Generate actionable recommendations based on category."""
-        recommendations = {
-            RCACategory.THERMAL: [
-                "Verify fan operation and replace if RPM < 1000",
-                "Clean dust from heatsinks and air intakes",
-                "Check thermal paste application on CPU",
-                "Reduce ambient temperature or improve rack airflow",
-                "Consider thermal throttling threshold adjustment"
-            ],
-            RCACategory.POWER: [
-                "Inspect power supply unit for failures",
-                "Measure voltage rails under load with oscilloscope",
-                "Check for loose power connectors",
-                "Verify power distribution board integrity",
-                "Replace PSU if voltage deviation exceeds 5%"
-            ],
-            RCACategory.FIRMWARE: [
-                "Reflash firmware to known-good version",
-                "Verify firmware checksums match golden image",
-                "Check for BIOS/UEFI corruption",
-                "Update to latest stable firmware release",
-                "Review boot logs for specific error codes"
-            ],
-            RCACategory.OS: [
-                "Boot in safe mode to isolate driver issues",
-                "Check kernel logs for panic messages",
-                "Verify boot image integrity",
-                "Test with minimal driver set",
-                "Reinstall OS if corruption suspected"
-            ],
-            RCACategory.UNKNOWN: [
-                "Collect full system logs for manual analysis",
-                "Run comprehensive hardware diagnostics",
-                "Check for intermittent connection issues",
-                "Monitor system over extended period",
-                "Escalate to hardware engineering team"
-            ]
-        }
-        
-        return recommendations.get(category, recommendations[RCACategory.UNKNOWN])
+        return _RECOMMENDATIONS.get(category, _RECOMMENDATIONS[RCACategory.UNKNOWN])
@@ -3,16 +3,54 @@ System simulation layer for hardware bring-up.
 Simulates boot stages, subsystems, and sensor readings.
 """
 
+import logging
 import random
 import time
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+import numpy as np
 from app.logger import get_logger
-from app.config import settings
+from app.config import get_settings
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain NumPy
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 logger = get_logger(__name__)
 
+# Settings read on hot paths, snapshotted at import; get_settings() is
+# cached for the life of the process, so these never change after startup
+_NOISE_PCT = get_settings().sensor_noise_percent / 100.0
+_REALISTIC_DELAYS = get_settings().enable_realistic_delays
+
+
+# Timestamps are recorded with time.monotonic_ns() and shifted onto the
+# wall clock only on egress, so they never go backwards within a process
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _to_wall_seconds(monotonic_ns: int) -> float:
+    """Convert a monotonic_ns() timestamp to Unix seconds."""
+    return (monotonic_ns + _WALL_CLOCK_OFFSET_NS) / 1e9
+
+
+@njit(cache=True)
+def _thermal_step(current: float, target: float, n_steps: int) -> np.ndarray:
+    """Temperatures of an n_steps linear ramp from current to target."""
+    step_size = (target - current) / n_steps
+    return current + step_size * np.arange(1, n_steps + 1)
+
+
+@njit(cache=True)
+def _apply_noise(values: np.ndarray, noise_pct: float) -> np.ndarray:
+    """Scale each value by independent uniform noise of +/- noise_pct."""
+    return values * (1 + np.random.uniform(-noise_pct, noise_pct, values.shape[0]))
+
 
 class BootStage(Enum):
     """Boot sequence stages."""
@@ -22,30 +60,46 @@ class BootStage(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
-class SensorReading:
+class SensorReading(NamedTuple):
     """Sensor reading with timestamp."""
     name: str
     value: float
     unit: str
     timestamp: float
-    
-    def to_dict(self) -> Dict:
-        return {
-            "name": self.name,
-            "value": round(self.value, 2),
-            "unit": self.unit,
-            "timestamp": self.timestamp
-        }
 
 
 class SystemSimulator:
     """
     Simulates a complete rack system with realistic hardware behavior.
     Deterministic boot sequence with configurable failure injection.
+    
+    Sensor history is a fixed-size ring buffer stored as a struct of arrays
+    (value, timestamp and sensor id per reading), so recording a reading
+    allocates nothing; only the latest _SENSOR_CAPACITY readings are kept.
+    Log and sensor timestamps are kept as monotonic_ns() integers.
     """
     
+    # Sensor history ring buffer size
+    _SENSOR_CAPACITY = 4096
+    
+    # (name, unit) pairs interned to small ids, shared by all instances
+    _sensor_ids: Dict[Tuple[str, str], int] = {}
+    _sensor_keys: List[Tuple[str, str]] = []
+    
     def __init__(self):
+        self.logs: List[Tuple[int, str]] = []  # (timestamp ns, message)
+        self._sh_values = np.empty(self._SENSOR_CAPACITY, dtype=np.float32)
+        self._sh_ts = np.empty(self._SENSOR_CAPACITY, dtype=np.int64)
+        self._sh_name_id = np.empty(self._SENSOR_CAPACITY, dtype=np.int16)
+        self.reset()
+    
+    def reset(self):
+        """
+        Reset system to initial state.
+        
+        Clears the logs and sensor history in place so the allocated
+        buffers are reused.
+        """
         self.boot_stage = BootStage.FIRMWARE
         self.cpu_temp = 25.0  # Celsius
         self.cpu_frequency = 2400  # MHz
@@ -55,47 +109,123 @@ class SystemSimulator:
         self.fan_rpm = 2000
         self.power_draw = 150  # Watts
         
-        self.logs: List[str] = []
-        self.sensor_history: List[SensorReading] = []
+        self.logs.clear()
+        self._sh_count = 0
         self.failed = False
         self.failure_reason = None
     
-    def reset(self):
-        """Reset system to initial state."""
-        self.__init__()
+    def inject(self, **fields):
+        """Set several state fields at once (e.g. cpu_temp, failed)."""
+        self.__dict__.update(fields)
     
     def add_log(self, message: str):
-        """Add timestamped log entry."""
-        timestamp = time.time()
-        log_entry = f"[{timestamp:.3f}] {message}"
-        self.logs.append(log_entry)
-        logger.debug("Simulator log", extra={"message": message})
+        """Add timestamped log entry (formatted on egress, see formatted_logs)."""
+        self.logs.append((time.monotonic_ns(), message))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Simulator log", extra={"log_message": message})
+    
+    def formatted_logs(self) -> Iterator[str]:
+        """Yield log entries formatted as '[timestamp] message'."""
+        for timestamp, message in self.logs:
+            yield f"[{_to_wall_seconds(timestamp):.3f}] {message}"
+    
+    @property
+    def sensor_history(self) -> List[SensorReading]:
+        """Recorded sensor readings, oldest first."""
+        n = self._sh_count
+        capacity = self._SENSOR_CAPACITY
+        if n > capacity:
+            # Buffer has wrapped; oldest retained reading is at n % capacity
+            window = np.arange(n - capacity, n) % capacity
+        else:
+            window = slice(0, n)
+        readings = []
+        for sensor_id, value, ts in zip(
+            self._sh_name_id[window].tolist(),
+            self._sh_values[window].tolist(),
+            self._sh_ts[window].tolist()
+        ):
+            name, unit = self._sensor_keys[sensor_id]
+            readings.append(SensorReading(name, value, unit, _to_wall_seconds(ts)))
+        return readings
     
-    def read_sensor(self, name: str, value: float, unit: str) -> SensorReading:
+    def dump_readings(self) -> List[Dict]:
+        """Serialize recorded sensor readings as dicts."""
+        return [
+            {
+                "name": reading.name,
+                "value": round(reading.value, 2),
+                "unit": reading.unit,
+                "timestamp": reading.timestamp
+            }
+            for reading in self.sensor_history
+        ]
+    
+    @classmethod
+    def _sensor_id(cls, name: str, unit: str) -> int:
+        """Intern a (name, unit) pair to a small integer id."""
+        key = (name, unit)
+        sensor_id = cls._sensor_ids.get(key)
+        if sensor_id is None:
+            sensor_id = cls._sensor_ids[key] = len(cls._sensor_keys)
+            cls._sensor_keys.append(key)
+        return sensor_id
+    
+    def _read_sensor_clean(self, name: str, value: float, unit: str) -> SensorReading:
         """
-        Record sensor reading with realistic noise.
+        Record sensor reading as-is (sensor noise disabled).
         """
-        if settings.sensor_noise_percent > 0:
-            noise = random.uniform(
-                -settings.sensor_noise_percent / 100,
-                settings.sensor_noise_percent / 100
-            )
-            value = value * (1 + noise)
+        timestamp = time.monotonic_ns()
+        
+        i = self._sh_count % self._SENSOR_CAPACITY
+        self._sh_values[i] = value
+        self._sh_ts[i] = timestamp
+        self._sh_name_id[i] = self._sensor_id(name, unit)
+        self._sh_count += 1
         
-        reading = SensorReading(
-            name=name,
-            value=value,
-            unit=unit,
-            timestamp=time.time()
+        return SensorReading(name, value, unit, _to_wall_seconds(timestamp))
+    
+    def _read_sensor_noisy(self, name: str, value: float, unit: str) -> SensorReading:
+        """
+        Record sensor reading with realistic noise.
+        """
+        return self._read_sensor_clean(
+            name, value * (1 + random.uniform(-_NOISE_PCT, _NOISE_PCT)), unit
         )
-        self.sensor_history.append(reading)
-        return reading
+    
+    # Chosen once at class creation (_NOISE_PCT is fixed at import), so the
+    # hot path has no noise check and instances hold no bound method
+    read_sensor = _read_sensor_noisy if _NOISE_PCT else _read_sensor_clean
+    
+    def extend_sensors(self, name: str, values: np.ndarray, unit: str):
+        """
+        Record a batch of readings for one sensor with realistic noise.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if _NOISE_PCT:
+            values = _apply_noise(values, _NOISE_PCT)
+        
+        capacity = self._SENSOR_CAPACITY
+        count = self._sh_count + len(values)
+        if len(values) > capacity:
+            values = values[-capacity:]
+        
+        start = (count - len(values)) % capacity
+        end = start + len(values)
+        if end <= capacity:
+            slots = slice(start, end)
+        else:
+            slots = np.arange(start, end) % capacity
+        self._sh_values[slots] = values
+        self._sh_ts[slots] = time.monotonic_ns()
+        self._sh_name_id[slots] = self._sensor_id(name, unit)
+        self._sh_count = count
     
     def boot_firmware(self) -> bool:
         """Execute firmware boot stage."""
         self.add_log("Starting firmware initialization")
         
-        if settings.enable_realistic_delays:
+        if _REALISTIC_DELAYS:
             time.sleep(0.1)
         
         # POST checks
@@ -117,7 +247,7 @@ class SystemSimulator:
         """Execute bootloader stage."""
         self.add_log("Loading bootloader")
         
-        if settings.enable_realistic_delays:
+        if _REALISTIC_DELAYS:
             time.sleep(0.05)
         
         self.cpu_frequency = 3200  # Increase frequency
@@ -140,7 +270,7 @@ class SystemSimulator:
         """Execute OS initialization."""
         self.add_log("Initializing operating system")
         
-        if settings.enable_realistic_delays:
+        if _REALISTIC_DELAYS:
             time.sleep(0.15)
         
         # Simulate OS load increasing power draw
@@ -154,16 +284,17 @@ class SystemSimulator:
         self.boot_stage = BootStage.COMPLETE
         return True
     
+    # Boot stages in order, as (name, method) pairs
+    _BOOT_SEQUENCE = (
+        ("Firmware", boot_firmware),
+        ("Bootloader", boot_bootloader),
+        ("OS", boot_os)
+    )
+    
     def full_boot_sequence(self) -> bool:
         """Execute complete boot sequence."""
-        stages = [
-            ("Firmware", self.boot_firmware),
-            ("Bootloader", self.boot_bootloader),
-            ("OS", self.boot_os)
-        ]
-        
-        for stage_name, stage_func in stages:
-            if not stage_func():
+        for stage_name, stage_func in self._BOOT_SEQUENCE:
+            if not stage_func(self):
                 self.add_log(f"Boot failed at {stage_name} stage")
                 return False
         
@@ -174,21 +305,25 @@ class SystemSimulator:
         """
         Simulate thermal ramp by gradually increasing temperature.
         """
-        steps = 10
-        temp_delta = target_temp - self.cpu_temp
-        step_size = temp_delta / steps
-        
-        for i in range(steps):
-            self.cpu_temp += step_size
-            self.read_sensor("cpu_temp", self.cpu_temp, "°C")
-            
-            # Simulate thermal throttling
-            if self.cpu_temp > 85:
-                self.cpu_frequency = max(1200, self.cpu_frequency - 200)
-                self.add_log(f"Thermal throttling: CPU freq reduced to {self.cpu_frequency} MHz")
-            
-            if settings.enable_realistic_delays:
-                time.sleep(duration_ms / steps / 1000)
+        temps = _thermal_step(float(self.cpu_temp), float(target_temp), 10)
+        
+        # Simulate thermal throttling: -200 MHz per step above 85°C, floor 1200
+        throttled = temps > 85
+        freqs = np.maximum(1200, self.cpu_frequency - 200 * np.cumsum(throttled))
+        
+        self.extend_sensors("cpu_temp", temps, "°C")
+        self.cpu_temp = float(temps[-1])
+        
+        throttled_steps = int(throttled.sum())
+        if throttled_steps:
+            self.cpu_frequency = int(freqs[-1])
+            self.add_log(
+                f"Thermal throttling: CPU freq reduced to {self.cpu_frequency} MHz "
+                f"over {throttled_steps} steps"
+            )
+        
+        if _REALISTIC_DELAYS:
+            time.sleep(duration_ms / 1000)
         
         self.add_log(f"Thermal load complete: {self.cpu_temp:.1f}°C")
     
@@ -229,5 +364,5 @@ class SystemSimulator:
             "voltage_3v3": round(self.voltage_3v3, 3),
             "fan_rpm": self.fan_rpm,
             "power_draw_w": round(self.power_draw, 2),
-            "sensor_readings": len(self.sensor_history)
+            "sensor_readings": self._sh_count
         }
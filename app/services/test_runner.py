@@ -4,18 +4,20 @@ Orchestrates test runs and coordinates with other services.
 """
 
 import asyncio
+import random
 import time
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 from sqlalchemy.orm import Session
+import numpy as np
 
 from app.models import TestRun, TestType, TestStatus, FailureType
 from app.services.system_simulator import SystemSimulator
-from app.services.failure_injector import FailureInjector
+from app.services import failure_injector, system_simulator
 from app.services.rca_engine import RCAEngine
 from app.logger import get_logger
-from app.config import settings
+from app.config import get_settings
 
 logger = get_logger(__name__)
 
@@ -31,6 +33,8 @@ class TestRunner:
     
     def __init__(self, db: Session):
         self.db = db
+        # Simulators are reused across attempts instead of reallocated
+        self._sim_pool: asyncio.LifoQueue = asyncio.LifoQueue()
     
     async def execute_test(
         self,
@@ -42,12 +46,13 @@ class TestRunner:
         Execute a test with retry logic and timeout enforcement.
         Returns test_id for tracking.
         """
+        settings = get_settings()
         test_id = str(uuid.uuid4())
         
         # Check idempotency - if test with same params exists and is running, return that
-        existing = self.db.query(TestRun).filter(
-            TestRun.test_type == test_type.value,
-            TestRun.status == TestStatus.RUNNING.value
+        existing = self.db.query(TestRun).with_entities(TestRun.test_id).filter(
+            TestRun.status == TestStatus.RUNNING.value,
+            TestRun.test_type == test_type.value
         ).first()
         
         if existing:
@@ -68,6 +73,8 @@ class TestRunner:
             metrics={}
         )
         self.db.add(test_run)
+        # Committed up front so concurrent requests see the RUNNING row
+        # in the idempotency check above
         self.db.commit()
         
         logger.info("Test execution started", extra={
@@ -78,30 +85,29 @@ class TestRunner:
         # Execute with retry logic
         for attempt in range(settings.max_retries):
             try:
-                result = await asyncio.wait_for(
-                    self._run_test(test_id, test_type, inject_failure, failure_probability),
+                status, error_code = await asyncio.wait_for(
+                    self._run_test(test_run, test_type, inject_failure, failure_probability),
                     timeout=settings.timeout_seconds
                 )
                 
-                # Update test run with results
-                test_run.status = result["status"]
-                test_run.duration_ms = result["duration_ms"]
+                # Remaining results were written onto test_run by _run_test
+                test_run.status = status
                 test_run.completed_at = datetime.utcnow()
-                test_run.metrics = result["metrics"]
-                test_run.logs = result["logs"]
-                test_run.error_code = result.get("error_code")
+                test_run.error_code = error_code
                 
+                # Single commit for the run update and any pending RCA record
                 self.db.commit()
                 
                 logger.info("Test execution completed", extra={
                     "test_id": test_id,
-                    "status": result["status"],
+                    "status": status,
                     "attempt": attempt + 1
                 })
                 
                 return test_id
             
             except asyncio.TimeoutError:
+                self.db.rollback()
                 logger.warning("Test execution timeout", extra={
                     "test_id": test_id,
                     "attempt": attempt + 1,
@@ -109,8 +115,7 @@ class TestRunner:
                 })
                 
                 if attempt < settings.max_retries - 1:
-                    # Exponential backoff
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._backoff_seconds(attempt))
                 else:
                     # Final timeout failure
                     test_run.status = TestStatus.TIMEOUT.value
@@ -120,6 +125,7 @@ class TestRunner:
                     return test_id
             
             except Exception as e:
+                self.db.rollback()
                 logger.error("Test execution error", extra={
                     "test_id": test_id,
                     "attempt": attempt + 1,
@@ -127,7 +133,7 @@ class TestRunner:
                 })
                 
                 if attempt < settings.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._backoff_seconds(attempt))
                 else:
                     test_run.status = TestStatus.FAILED.value
                     test_run.completed_at = datetime.utcnow()
@@ -138,57 +144,74 @@ class TestRunner:
         
         return test_id
     
+    @staticmethod
+    def _backoff_seconds(attempt: int) -> float:
+        """
+        Jittered exponential backoff, capped at max_backoff_seconds.
+        
+        The jitter keeps concurrently failing tests from retrying in lockstep.
+        """
+        return min(
+            get_settings().max_backoff_seconds,
+            random.uniform(0.1, 0.1 * (2 ** attempt))
+        )
+    
     async def _run_test(
         self,
-        test_id: str,
+        test_run: TestRun,
         test_type: TestType,
         inject_failure: FailureType,
         failure_probability: float
-    ) -> dict:
-        """Execute the actual test logic."""
-        start_time = time.time()
-        
-        simulator = SystemSimulator()
-        injector = FailureInjector(simulator)
-        
-        # Inject failure if requested
-        if inject_failure != FailureType.NONE:
-            injector.inject_failure(inject_failure, failure_probability)
-        
-        # Run test based on type
-        if test_type == TestType.THERMAL_RAMP:
-            success = await self._thermal_ramp_test(simulator)
-        elif test_type == TestType.POWER_STRESS:
-            success = await self._power_stress_test(simulator)
-        elif test_type == TestType.CPU_STABILITY:
-            success = await self._cpu_stability_test(simulator)
-        elif test_type == TestType.FIRMWARE_HANDOFF:
-            success = await self._firmware_handoff_test(simulator)
-        else:
-            raise ValueError(f"Unknown test type: {test_type}")
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Execute the actual test logic.
         
-        duration_ms = (time.time() - start_time) * 1000
+        Writes duration, metrics and logs straight onto test_run and
+        returns (status, error_code).
+        """
+        start_time = time.monotonic_ns()
         
-        # Determine status
-        if success and not simulator.failed:
-            status = TestStatus.PASSED.value
-            error_code = None
+        if self._sim_pool.empty():
+            simulator = SystemSimulator()
         else:
-            status = TestStatus.FAILED.value
-            error_code = simulator.failure_reason or "UNKNOWN"
+            simulator = self._sim_pool.get_nowait()
+            simulator.reset()
         
-        # Run RCA if test failed
-        if status == TestStatus.FAILED.value:
-            rca_engine = RCAEngine(self.db)
-            await rca_engine.analyze_failure(test_id, simulator)
-        
-        return {
-            "status": status,
-            "duration_ms": round(duration_ms, 2),
-            "metrics": simulator.get_metrics(),
-            "logs": simulator.logs,
-            "error_code": error_code
-        }
+        try:
+            # Inject failure if requested
+            if inject_failure != FailureType.NONE:
+                failure_injector.inject_failure(simulator, inject_failure, failure_probability)
+            
+            # Run test based on type
+            handler = self._TEST_HANDLERS.get(test_type)
+            if handler is None:
+                raise ValueError(f"Unknown test type: {test_type}")
+            success = await handler(self, simulator)
+            
+            duration_ms = (time.monotonic_ns() - start_time) / 1e6
+            
+            # Determine status
+            if success and not simulator.failed:
+                status = TestStatus.PASSED.value
+                error_code = None
+            else:
+                status = TestStatus.FAILED.value
+                error_code = simulator.failure_reason or "UNKNOWN"
+            
+            # Run RCA if test failed. This only adds the RCA record to the
+            # session; it is written by the caller's single commit, so there
+            # is no separate DB round-trip to overlap with the run update.
+            if status == TestStatus.FAILED.value:
+                rca_engine = RCAEngine(self.db)
+                await rca_engine.analyze_failure(test_run.test_id, simulator)
+            
+            test_run.duration_ms = round(duration_ms, 2)
+            test_run.metrics = simulator.get_metrics()
+            test_run.logs = list(simulator.formatted_logs())
+            
+            return status, error_code
+        finally:
+            self._sim_pool.put_nowait(simulator)
     
     async def _thermal_ramp_test(self, simulator: SystemSimulator) -> bool:
         """Thermal ramp test: 25°C → 85°C gradual increase."""
@@ -237,12 +260,13 @@ class TestRunner:
         simulator.cpu_frequency = 3600  # Max frequency
         simulator.cpu_temp = 75.0
         
-        for i in range(5):
-            simulator.read_sensor("cpu_temp", simulator.cpu_temp, "°C")
-            simulator.read_sensor("cpu_freq", simulator.cpu_frequency, "MHz")
-            
-            if settings.enable_realistic_delays:
-                await asyncio.sleep(0.2)
+        # Five samples of each sensor over the soak, recorded in one batch
+        simulator.extend_sensors("cpu_temp", np.full(5, simulator.cpu_temp), "°C")
+        simulator.extend_sensors("cpu_freq", np.full(5, simulator.cpu_frequency), "MHz")
+        
+        # Same import-time snapshot the simulator's own delays use
+        if system_simulator._REALISTIC_DELAYS:
+            await asyncio.sleep(1.0)
         
         simulator.add_log("CPU stability test completed successfully")
         return True
@@ -275,3 +299,11 @@ class TestRunner:
         
         simulator.add_log("Firmware handoff test completed successfully")
         return True
+    
+    # Test type -> test implementation
+    _TEST_HANDLERS = {
+        TestType.THERMAL_RAMP: _thermal_ramp_test,
+        TestType.POWER_STRESS: _power_stress_test,
+        TestType.CPU_STABILITY: _cpu_stability_test,
+        TestType.FIRMWARE_HANDOFF: _firmware_handoff_test
+    }
@@ -2,26 +2,32 @@
 Simplified main for testing deployment.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+import orjson
 
-app = FastAPI(title="RackLab-RTP", version="1.0.0")
+app = FastAPI(title="RackLab-RTP", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Static responses, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to RackLab-RTP",
+    "status": "running",
+    "version": "1.0.0"
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "service": "RackLab-RTP"
+})
 
 
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Welcome to RackLab-RTP",
-        "status": "running",
-        "version": "1.0.0"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "service": "RackLab-RTP"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -0,0 +1,113 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import get_db
+from app.main import app
+from app.models import Base
+from app.services.rca_engine import RCAEngine
+from app.services.system_simulator import SystemSimulator, _apply_noise, _thermal_step
+
+
+class _FakeQuery:
+    """Query stub: chains like a Query and finds nothing."""
+    __slots__ = ()
+    
+    def with_entities(self, *entities):
+        return self
+    
+    def filter(self, *criteria):
+        return self
+    
+    def first(self):
+        return None
+
+
+class FakeDB:
+    """Minimal stand-in for a SQLAlchemy Session that records writes."""
+    __slots__ = ("added", "committed", "rolled_back")
+    
+    def __init__(self):
+        self.added = []
+        self.committed = 0
+        self.rolled_back = 0
+    
+    def query(self, *entities):
+        return _FakeQuery()
+    
+    def add(self, instance):
+        self.added.append(instance)
+    
+    def commit(self):
+        self.committed += 1
+    
+    def rollback(self):
+        self.rolled_back += 1
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warmup_jit():
+    """Compile the simulator's Numba kernels (if enabled) before any test runs."""
+    _thermal_step(25.0, 26.0, 1)
+    _apply_noise(np.zeros(1), 0.0)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip the simulator's realistic-delay sleeps."""
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(scope="module")
+def shared_simulator():
+    """One SystemSimulator per test module; use `simulator` in tests."""
+    return SystemSimulator()
+
+
+@pytest.fixture
+def simulator(shared_simulator):
+    """The module's simulator, reset to its initial state."""
+    shared_simulator.reset()
+    return shared_simulator
+
+
+@pytest.fixture
+def mock_db():
+    """Fresh fake DB session."""
+    return FakeDB()
+
+
+@pytest.fixture
+def sqlite_db():
+    """Session on a fresh in-memory SQLite database with the tables created."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autoflush=False, bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(sqlite_db):
+    """TestClient whose requests use the `sqlite_db` session."""
+    app.dependency_overrides[get_db] = lambda: sqlite_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="module")
+def rca_engine():
+    """RCAEngine shared by a test module; its tests never inspect DB writes."""
+    return RCAEngine(SimpleNamespace(add=lambda instance: None))
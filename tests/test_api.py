@@ -0,0 +1,139 @@
+"""
+API tests against an in-memory SQLite database.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from app.models import TestRun, RCARecord
+
+pytestmark = pytest.mark.fast
+
+
+def _add_run(db, test_id, started_at, rca_causes=(), logs=()):
+    """Insert a completed test run and one RCA record per root cause."""
+    db.add(TestRun(
+        test_id=test_id,
+        test_type="thermal_ramp",
+        status="failed",
+        duration_ms=1.0,
+        started_at=started_at,
+        completed_at=started_at + timedelta(seconds=1),
+        metrics={"max_temp": 95.5},
+        logs=list(logs)
+    ))
+    for cause in rca_causes:
+        db.add(RCARecord(
+            test_id=test_id,
+            category="thermal",
+            confidence=0.9,
+            root_cause=cause,
+            recommendations=["Check fans", "Reseat heatsink"]
+        ))
+        # Flush per record so ids follow insertion order
+        db.flush()
+    db.commit()
+
+
+def test_run_with_several_rca_records_listed_once(client, sqlite_db):
+    """A run with several RCA records appears once, with the newest."""
+    now = datetime.utcnow()
+    _add_run(sqlite_db, "multi", now, rca_causes=("old", "new"))
+    _add_run(sqlite_db, "single", now - timedelta(minutes=1), rca_causes=("only",))
+    
+    # limit counts test runs, not joined rows
+    rows = client.get("/api/tests", params={"limit": 2}).json()
+    
+    assert [(r["test_id"], r["rca_result"]["root_cause"]) for r in rows] == [
+        ("multi", "new"), ("single", "only")
+    ]
+
+
+def test_get_test_result_uses_latest_rca(client, sqlite_db):
+    """The single-run lookup returns the newest RCA record."""
+    _add_run(sqlite_db, "multi", datetime.utcnow(), rca_causes=("old", "new"))
+    
+    response = client.get("/api/tests/multi")
+    
+    assert response.status_code == 200
+    assert response.json()["rca_result"]["root_cause"] == "new"
+
+
+def _expected_markdown(test_run, rca):
+    """The Markdown report as the non-streaming export built it."""
+    md_content = f"""# Test Report: {test_run.test_id}
+
+## Summary
+- **Test Type**: {test_run.test_type}
+- **Status**: {test_run.status}
+- **Duration**: {test_run.duration_ms}ms
+- **Started**: {test_run.started_at}
+- **Completed**: {test_run.completed_at}
+
+## Metrics
+```json
+{test_run.metrics}
+```
+
+## Logs
+```
+{chr(10).join(test_run.logs or [])}
+```
+"""
+    if rca:
+        md_content += f"""
+## Root Cause Analysis
+- **Category**: {rca.category}
+- **Confidence**: {rca.confidence * 100}%
+- **Root Cause**: {rca.root_cause}
+
+### Recommendations
+{chr(10).join(f"- {r}" for r in rca.recommendations or [])}
+"""
+    return md_content.encode("utf-8")
+
+
+@pytest.mark.parametrize("rca_causes,logs", [
+    (("thermal runaway",), ("boot ok", "temp 95.5C")),
+    ((), ()),
+], ids=["rca_with_logs", "no_rca_no_logs"])
+def test_markdown_export_matches_unstreamed_report(client, sqlite_db, rca_causes, logs):
+    """The streamed Markdown export is byte-identical to the one-shot report."""
+    _add_run(sqlite_db, "md", datetime.utcnow(), rca_causes=rca_causes, logs=logs)
+    test_run = sqlite_db.query(TestRun).one()
+    rca = sqlite_db.query(RCARecord).first()
+    
+    response = client.get("/api/export/md", params={"format": "markdown"})
+    
+    assert response.status_code == 200
+    assert response.content == _expected_markdown(test_run, rca)
+
+
+def test_health_etag_revalidates(client):
+    """/health sends cache headers and answers a matching If-None-Match with 304."""
+    response = client.get("/health")
+    etag = response.headers["etag"]
+    
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=5"
+    
+    revalidated = client.get("/health", headers={"If-None-Match": etag})
+    
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+def test_dashboard_etag_tracks_status_counts(client, sqlite_db):
+    """The dashboard 304s while the stats are unchanged and re-renders after."""
+    response = client.get("/")
+    etag = response.headers["etag"]
+    
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=5"
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    
+    _add_run(sqlite_db, "new-run", datetime.utcnow())
+    response = client.get("/", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -3,54 +3,39 @@ Unit tests for RCAEngine.
 """
 
 import pytest
-from unittest.mock import MagicMock
-from app.services.rca_engine import RCAEngine, RCACategory
-from app.services.system_simulator import SystemSimulator
+from app.services.rca_engine import RCACategory
 
-
-@pytest.mark.asyncio
-async def test_thermal_failure_classification():
-    """Test RCA correctly identifies thermal failures."""
-    mock_db = MagicMock()
-    rca_engine = RCAEngine(mock_db)
-    
-    simulator = SystemSimulator()
-    simulator.cpu_temp = 95.0
-    simulator.failed = True
-    simulator.failure_reason = "thermal_runaway"
-    
-    features = rca_engine._extract_features(simulator)
-    category, confidence = rca_engine._classify_failure(features)
-    
-    assert category == RCACategory.THERMAL
-    assert confidence > 0.8
+# Async tests in this module share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest.mark.asyncio
-async def test_power_failure_classification():
-    """Test RCA correctly identifies power failures."""
-    mock_db = MagicMock()
-    rca_engine = RCAEngine(mock_db)
-    
-    simulator = SystemSimulator()
-    simulator.voltage_12v = 10.5
-    simulator.failed = True
-    simulator.failure_reason = "voltage_droop"
-    
-    features = rca_engine._extract_features(simulator)
-    category, confidence = rca_engine._classify_failure(features)
-    
-    assert category == RCACategory.POWER
-    assert confidence > 0.5
+@pytest.mark.fast
+@pytest.mark.parametrize("cpu_temp,voltage_12v,reason,expected_category,min_confidence", [
+    # Thermal confidence scales from 85°C to 100°C: (95 - 85) / 15 = 0.67
+    (95.0, 12.0, "thermal_runaway", RCACategory.THERMAL, 0.6),
+    (25.0, 10.5, "voltage_droop", RCACategory.POWER, 0.5),
+], ids=["thermal", "power"])
+async def test_failure_classification(
+    rca_engine, simulator, cpu_temp, voltage_12v, reason, expected_category, min_confidence
+):
+    """Test RCA correctly identifies thermal and power failures."""
+    simulator.inject(
+        cpu_temp=cpu_temp,
+        voltage_12v=voltage_12v,
+        failed=True,
+        failure_reason=reason
+    )
+    
+    category, confidence = rca_engine._classify_failure(simulator)
+    
+    assert category == expected_category
+    assert confidence > min_confidence
 
 
-@pytest.mark.asyncio
-async def test_recommendations_generated():
+@pytest.mark.fast
+async def test_recommendations_generated(rca_engine):
     """Test that recommendations are generated for each category."""
-    mock_db = MagicMock()
-    rca_engine = RCAEngine(mock_db)
-    
     recommendations = rca_engine._generate_recommendations(RCACategory.THERMAL)
     
     assert len(recommendations) > 0
-    assert any("fan" in r.lower() for r in recommendations)
+    assert "fan" in " ".join(recommendations).lower()
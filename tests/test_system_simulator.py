@@ -2,14 +2,15 @@
 Unit tests for SystemSimulator.
 """
 
+import numpy as np
 import pytest
-from app.services.system_simulator import SystemSimulator, BootStage
+from app.services import system_simulator
+from app.services.system_simulator import BootStage, SystemSimulator
 
 
-def test_system_boot_sequence():
+@pytest.mark.slow
+def test_system_boot_sequence(simulator):
     """Test complete boot sequence executes successfully."""
-    simulator = SystemSimulator()
-    
     success = simulator.full_boot_sequence()
     
     assert success is True
@@ -18,21 +19,21 @@ def test_system_boot_sequence():
     assert not simulator.failed
 
 
-def test_thermal_load_application():
+@pytest.mark.slow
+def test_thermal_load_application(simulator):
     """Test thermal load increases temperature correctly."""
-    simulator = SystemSimulator()
     initial_temp = simulator.cpu_temp
     
-    simulator.apply_thermal_load(target_temp=85.0, duration_ms=1000)
+    simulator.apply_thermal_load(target_temp=85.0, duration_ms=10)
     
     assert simulator.cpu_temp > initial_temp
     assert simulator.cpu_temp >= 80.0  # Should reach near target
     assert len(simulator.sensor_history) > 0
 
 
-def test_voltage_droop_detection():
+@pytest.mark.fast
+def test_voltage_droop_detection(simulator):
     """Test voltage droop causes failure."""
-    simulator = SystemSimulator()
     simulator.voltage_12v = 10.0  # Below tolerance
     
     success = simulator.boot_firmware()
@@ -42,21 +43,20 @@ def test_voltage_droop_detection():
     assert simulator.failure_reason == "voltage_droop"
 
 
-def test_sensor_readings_recorded():
+@pytest.mark.fast
+def test_sensor_readings_recorded(simulator):
     """Test sensor readings are properly recorded."""
-    simulator = SystemSimulator()
-    
-    reading = simulator.read_sensor("test_sensor", 42.0, "units")
+    name, value, unit, _ = simulator.read_sensor("test_sensor", 42.0, "units")
     
-    assert reading.name == "test_sensor"
-    assert reading.value == pytest.approx(42.0, abs=1.0)  # Allow for noise
-    assert reading.unit == "units"
+    assert name == "test_sensor"
+    assert abs(value - 42.0) <= 1.0  # Allow for noise
+    assert unit == "units"
     assert len(simulator.sensor_history) == 1
 
 
-def test_reset_clears_state():
+@pytest.mark.fast
+def test_reset_clears_state(simulator):
     """Test reset returns simulator to initial state."""
-    simulator = SystemSimulator()
     simulator.full_boot_sequence()
     simulator.failed = True
     
@@ -65,3 +65,33 @@ def test_reset_clears_state():
     assert simulator.boot_stage == BootStage.FIRMWARE
     assert len(simulator.logs) == 0
     assert not simulator.failed
+
+
+@pytest.mark.fast
+def test_sensor_history_ring_buffer_wraps(monkeypatch):
+    """Test sensor history keeps the latest readings, oldest first, once full."""
+    monkeypatch.setattr(system_simulator, "_NOISE_PCT", 0.0)
+    monkeypatch.setattr(SystemSimulator, "_SENSOR_CAPACITY", 8)
+    simulator = SystemSimulator()
+    
+    for i in range(5):
+        simulator.read_sensor("a", float(i), "u")
+    # Batch that wraps past the end of the buffer
+    simulator.extend_sensors("b", np.arange(10.0, 16.0), "u")
+    
+    assert [(r.name, r.value) for r in simulator.sensor_history] == [
+        ("a", 3.0), ("a", 4.0),
+        ("b", 10.0), ("b", 11.0), ("b", 12.0), ("b", 13.0), ("b", 14.0), ("b", 15.0)
+    ]
+    
+    # Batch larger than the buffer keeps only its tail
+    simulator.extend_sensors("c", np.arange(100.0, 120.0), "u")
+    assert [r.value for r in simulator.sensor_history] == [float(v) for v in range(112, 120)]
+    
+    # Single reading after a wrap lands in the oldest slot
+    simulator.read_sensor("d", 1.0, "u")
+    history = simulator.sensor_history
+    assert [r.value for r in history] == [float(v) for v in range(113, 120)] + [1.0]
+    assert history[-1].name == "d"
+    
+    assert simulator.get_metrics()["sensor_readings"] == 5 + 6 + 20 + 1